@@ -1,13 +1,29 @@
+import time
 import socket
+from functools import lru_cache
 
 from azure.data.tables import TableServiceClient, UpdateMode
-from azure.core.exceptions import ResourceExistsError
+from azure.core.exceptions import AzureError, ResourceExistsError
 
+# Table clients (and their TLS connections) shared by every Send instance
+_table_clients = {}
+
+
+def getTableClient(connection_string, table_name):
+    key = (connection_string, table_name)
+    if key not in _table_clients:
+        _table_clients[key] = TableServiceClient.from_connection_string(conn_str=connection_string).get_table_client(table_name=table_name)
+    return _table_clients[key]
+
+@lru_cache(maxsize=1)
 def getHostIP():
-    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    s.connect(('1.1.1.1', 1))
-    local_ip = s.getsockname()[0]
-    return local_ip
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect(('1.1.1.1', 1))
+        return s.getsockname()[0]
+
+@lru_cache(maxsize=1)
+def getMoabID():
+    return getHostIP().replace(".", "")
 
 class Ball:
     __moab_local_ip = None
@@ -18,7 +34,7 @@ class Ball:
 
     def __init__(self) -> None:
         self.__local_ip = getHostIP()
-        self.__moab_local_ip = str(self.__local_ip).replace(".", "")
+        self.__moab_local_ip = getMoabID()
         self.__product = u'ball detect'
         self.__status_of_ball = False
         self.__ball = {
@@ -36,27 +52,55 @@ class Send:
     __connection_string = None
     __table_service_client = None
     __table_name = None
+    __flush_count = 8  # Send a batch after this many status updates...
+    __flush_interval = 1.0  # ...or once this many seconds have passed
 
     def __init__(self) -> None:
         self.__table_name = "BALL"
         self.__connection_string = ""
-        self.__table_service_client = TableServiceClient.from_connection_string(conn_str=self.__connection_string).get_table_client(table_name=self.__table_name)
+        self.__table_service_client = getTableClient(self.__connection_string, self.__table_name)
+        self.__pending = {}
+        self.__queued = 0
+        self.__last_flush = time.monotonic()
         self.createRow({
-            u'PartitionKey': str(getHostIP()).replace(".", ""),
+            u'PartitionKey': getMoabID(),
             u'RowKey': u'ball detect',
             u'IP': getHostIP(),
             u'STATUS': False
         })
-    
+
     def sendStatusOfBall(self, ball):
+        # A transaction may only touch each entity once. Repeats of the same
+        # status can be merged, but a change must not overwrite the status
+        # still waiting to be sent, so send that one first.
+        waiting = self.__pending.get(ball["RowKey"])
+        if waiting is not None and waiting["STATUS"] != ball["STATUS"]:
+            self.flush(force=True)
+        self.__pending[ball["RowKey"]] = dict(ball)
+        self.__queued += 1
+        if self.__queued >= self.__flush_count:
+            self.flush(force=True)
+        else:
+            self.flush()
+
+    def flush(self, force=False):
+        if not self.__pending:
+            return
+        if not force and time.monotonic() - self.__last_flush < self.__flush_interval:
+            return
+
+        operations = [("upsert", e, {"mode": UpdateMode.MERGE}) for e in self.__pending.values()]
+        self.__pending = {}
+        self.__queued = 0
+        self.__last_flush = time.monotonic()
         try:
-            self.__table_service_client.update_entity(mode=UpdateMode.MERGE, entity=ball)
-        except ResourceExistsError as e:
+            self.__table_service_client.submit_transaction(operations)
+        except AzureError as e:
+            # Includes ResourceExistsError and TableTransactionError
             print (e)
-    
+
     def createRow(self, ball):
         try:
             entity = self.__table_service_client.create_entity(entity=ball)
         except ResourceExistsError as e:
             print("Moab is registreted at Azure table")
-
@@ -2,8 +2,9 @@
 # Licensed under the MIT License.
 
 import sys
+import json
 import time
-import requests
+import urllib3
 import numpy as np
 import logging as log
 
@@ -25,21 +26,22 @@ def pid_controller(
 ):
     def next_action(state):
         env_state, ball_detected, buttons = state
+        if not ball_detected:
+            # Move plate back to flat
+            return Vector2(0, 0), {}
+
         x, y, vel_x, vel_y, sum_x, sum_y = env_state
 
-        if ball_detected:
-            action_x = Kp * x + Ki * sum_x + Kd * vel_x
-            action_y = Kp * y + Ki * sum_y + Kd * vel_y
-            action_x = np.clip(action_x, -max_angle, max_angle)
-            action_y = np.clip(action_y, -max_angle, max_angle)
+        # Kept as scalar math on purpose: for two axes, building a (3, 2)
+        # error matrix for a gains @ err matmul costs more on the Pi than
+        # the six multiplies it replaces.
+        action_x = Kp * x + Ki * sum_x + Kd * vel_x
+        action_y = Kp * y + Ki * sum_y + Kd * vel_y
+        # Plain min/max: np.clip on a scalar goes through ufunc dispatch
+        action_x = max(-max_angle, min(max_angle, action_x))
+        action_y = max(-max_angle, min(max_angle, action_y))
 
-            action = Vector2(action_x, action_y)
-
-        else:
-            # Move plate back to flat
-            action = Vector2(0, 0)
-
-        return action, {}
+        return Vector2(action_x, action_y), {}
 
     return next_action
 
@@ -78,6 +80,9 @@ def brain_controller(
     port=5555,
     client_id=123,
     alert_fn=None,
+    connect_timeout=0.1,  # Seconds
+    read_timeout=0.2,  # Seconds; a few control ticks for brain inference
+    max_timeouts=3,  # Timeouts in a row before the brain counts as failing
     **kwargs,
 ):
     """
@@ -92,9 +97,17 @@ def brain_controller(
     endpoint. This way we don't need to know information about what the trained
     brain was called to navigate the json response.
     """
+    # Keep one pooled keep-alive connection to the brain for the whole run
+    # instead of reconnecting to localhost on every control tick. urllib3 is
+    # used directly since requests' per-call overhead is larger than the
+    # loopback round trip itself.
+    http = urllib3.PoolManager(num_pools=1, maxsize=2, retries=False)
+    headers = {"Content-Type": "application/json"}
+    timeout = urllib3.Timeout(connect=connect_timeout, read=read_timeout)
+
     # Reset memory if a v2 brain
-    status = requests.delete(f"http://localhost:{port}/v2/clients/{client_id}")
-    version = 2 if status.status_code == 204 else 1
+    status = http.urlopen("DELETE", f"http://localhost:{port}/v2/clients/{client_id}")
+    version = 2 if status.status == 204 else 1
 
     if version == 1:
         prediction_url = f"http://localhost:{port}/v1/prediction"
@@ -103,92 +116,165 @@ def brain_controller(
     else:
         raise ValueError("Brain version `{self.version}` is not supported.")
 
+    # The observables are always the same four floats, so format the JSON body
+    # directly instead of building a dict and running json.dumps every tick
+    observables_v1 = (
+        '{{"ball_x": {:.6f}, "ball_y": {:.6f}, '
+        '"ball_vel_x": {:.6f}, "ball_vel_y": {:.6f}}}'
+    ).format
+    observables_v2 = (
+        '{{"state": {{"ball_x": {:.6f}, "ball_y": {:.6f}, '
+        '"ball_vel_x": {:.6f}, "ball_vel_y": {:.6f}}}}}'
+    ).format
+
+    last_alert = None
+    timeouts = 0  # Consecutive timed out requests
+    last_action = Vector2(0, 0)
+
+    def alert(is_error):
+        # Only call alert_fn when the brain goes from ok to failing or back,
+        # not on every tick
+        nonlocal last_alert
+        if alert_fn is not None and is_error != last_alert:
+            alert_fn(is_error)
+        last_alert = is_error
+
     def next_action_v1(state):
+        nonlocal timeouts, last_action
         env_state, ball_detected, buttons = state
-        x, y, vel_x, vel_y, sum_x, sum_y = env_state
-
-        observables = {
-            "ball_x": x,
-            "ball_y": y,
-            "ball_vel_x": vel_x,
-            "ball_vel_y": vel_y,
-        }
 
         action = Vector2(0, 0)  # Action is 0,0 if not detected or brain didn't work
         info = {"status": 400, "resp": ""}
-        if ball_detected:
-
-            # Trap on GET failures so we can restart the brain without
-            # bringing down this run loop. Plate will default to level
-            # when it loses the connection.
-            try:
-                # Get action from brain
-                response = requests.get(prediction_url, json=observables)
-                info = {"status": response.status_code, "resp": response.json()}
-
-                if response.ok:
-                    pitch = info["resp"]["input_pitch"]
-                    roll = info["resp"]["input_roll"]
-
-                    # Scale and clip
-                    pitch = np.clip(pitch * max_angle, -max_angle, max_angle)
-                    roll = np.clip(roll * max_angle, -max_angle, max_angle)
-
-                    # To match how the old brain works (only integer plate angles)
-                    pitch, roll = int(pitch), int(roll)
-                    action = Vector2(-roll, pitch)
-
-            except requests.exceptions.ConnectionError as e:
-                print(f"No brain listening on port: {port}", file=sys.stderr)
-                raise BrainNotFound
-            except Exception as e:
-                print(f"Brain exception: {e}")
+        if not ball_detected:
+            return action, info
+
+        x, y, vel_x, vel_y, sum_x, sum_y = env_state
+
+        observables = observables_v1(x, y, vel_x, vel_y).encode()
+
+        # Trap on GET failures so we can restart the brain without
+        # bringing down this run loop. Plate will default to level
+        # when it loses the connection.
+        try:
+            # Get action from brain
+            response = http.urlopen(
+                "GET",
+                prediction_url,
+                body=observables,
+                headers=headers,
+                timeout=timeout,
+            )
+            ok = response.status < 400
+            info = {"status": response.status, "resp": json.loads(response.data)}
+            alert(not ok)
+            timeouts = 0
+
+            if ok:
+                pitch = info["resp"]["input_pitch"]
+                roll = info["resp"]["input_roll"]
+
+                # Scale and clip
+                pitch = np.clip(pitch * max_angle, -max_angle, max_angle)
+                roll = np.clip(roll * max_angle, -max_angle, max_angle)
+
+                # To match how the old brain works (only integer plate angles)
+                pitch, roll = int(pitch), int(roll)
+                action = Vector2(-roll, pitch)
+                last_action = action
+
+        except (
+            urllib3.exceptions.NewConnectionError,
+            urllib3.exceptions.ProtocolError,
+        ) as e:
+            # Checked before timeouts: NewConnectionError is also a
+            # ConnectTimeoutError
+            print(f"No brain listening on port: {port}", file=sys.stderr)
+            raise BrainNotFound
+        except urllib3.exceptions.TimeoutError as e:
+            # A slow brain shouldn't stall the control loop. Hold the last
+            # action through an occasional slow reply; only once several
+            # time out in a row level the plate and report the brain failing.
+            timeouts += 1
+            info = {"status": 408, "resp": ""}
+            if timeouts < max_timeouts:
+                action = last_action
+            else:
+                if timeouts == max_timeouts:
+                    print(f"Brain timed out on port: {port}", file=sys.stderr)
+                alert(True)
+        except Exception as e:
+            print(f"Brain exception: {e}")
+            alert(True)
         return action, info
 
     def next_action_v2(state):
+        nonlocal timeouts, last_action
         env_state, ball_detected, buttons = state
-        x, y, vel_x, vel_y, sum_x, sum_y = env_state
-
-        observables = {
-            "state": {
-                "ball_x": x,
-                "ball_y": y,
-                "ball_vel_x": vel_x,
-                "ball_vel_y": vel_y,
-            }
-        }
 
         action = Vector2(0, 0)  # Action is 0,0 if not detected or brain didn't work
         info = {"status": 400, "resp": ""}
-        if ball_detected:
-
-            # Trap on GET failures so we can restart the brain without
-            # bringing down this run loop. Plate will default to level
-            # when it loses the connection.
-            try:
-                # Get action from brain
-                response = requests.post(prediction_url, json=observables)
-                info = {"status": response.status_code, "resp": response.json()}
-
-                if response.ok:
-                    concepts = info["resp"]["concepts"]
-                    concept_name = list(concepts.keys())[0]  # Just use first concept
-                    pitch = concepts[concept_name]["action"]["input_pitch"]
-                    roll = concepts[concept_name]["action"]["input_roll"]
-
-                    # Scale and clip
-                    pitch = np.clip(pitch * max_angle, -max_angle, max_angle)
-                    roll = np.clip(roll * max_angle, -max_angle, max_angle)
-
-                    # To match how the old brain works (only integer plate angles)
-                    pitch, roll = int(pitch), int(roll)
-                    action = Vector2(-roll, pitch)
-
-            except requests.exceptions.ConnectionError as e:
-                print(f"No brain listening on port: {port}", file=sys.stderr)
-                raise BrainNotFound
-            except Exception as e:
-                print(f"Brain exception: {e}")
+        if not ball_detected:
+            return action, info
+
+        x, y, vel_x, vel_y, sum_x, sum_y = env_state
+
+        observables = observables_v2(x, y, vel_x, vel_y).encode()
+
+        # Trap on GET failures so we can restart the brain without
+        # bringing down this run loop. Plate will default to level
+        # when it loses the connection.
+        try:
+            # Get action from brain
+            response = http.urlopen(
+                "POST",
+                prediction_url,
+                body=observables,
+                headers=headers,
+                timeout=timeout,
+            )
+            ok = response.status < 400
+            info = {"status": response.status, "resp": json.loads(response.data)}
+            alert(not ok)
+            timeouts = 0
+
+            if ok:
+                concepts = info["resp"]["concepts"]
+                concept_name = list(concepts.keys())[0]  # Just use first concept
+                pitch = concepts[concept_name]["action"]["input_pitch"]
+                roll = concepts[concept_name]["action"]["input_roll"]
+
+                # Scale and clip
+                pitch = np.clip(pitch * max_angle, -max_angle, max_angle)
+                roll = np.clip(roll * max_angle, -max_angle, max_angle)
+
+                # To match how the old brain works (only integer plate angles)
+                pitch, roll = int(pitch), int(roll)
+                action = Vector2(-roll, pitch)
+                last_action = action
+
+        except (
+            urllib3.exceptions.NewConnectionError,
+            urllib3.exceptions.ProtocolError,
+        ) as e:
+            # Checked before timeouts: NewConnectionError is also a
+            # ConnectTimeoutError
+            print(f"No brain listening on port: {port}", file=sys.stderr)
+            raise BrainNotFound
+        except urllib3.exceptions.TimeoutError as e:
+            # A slow brain shouldn't stall the control loop. Hold the last
+            # action through an occasional slow reply; only once several
+            # time out in a row level the plate and report the brain failing.
+            timeouts += 1
+            info = {"status": 408, "resp": ""}
+            if timeouts < max_timeouts:
+                action = last_action
+            else:
+                if timeouts == max_timeouts:
+                    print(f"Brain timed out on port: {port}", file=sys.stderr)
+                alert(True)
+        except Exception as e:
+            print(f"Brain exception: {e}")
+            alert(True)
         return action, info
 
     if version == 1:
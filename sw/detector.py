@@ -5,10 +5,13 @@
 HSV filtering ball detector
 """
 
+import os
 import cv2
 import math
+import logging as log
 import numpy as np
 from hsv import hue_to_bgr
+from frame_ring import FrameRingWriter
 from huemask import hue_mask
 from common import Vector2, CircleFeature, Calibration
 
@@ -56,11 +59,30 @@ def save_img(filepath, img, rotated=False, quality=80):
         img = cv2.warpAffine(img, M, (w, h))
         img = img[::-1, :, :]  # Mirror along x axis
 
-    cv2.imwrite(
-        filepath,
-        img,
-        [cv2.IMWRITE_JPEG_QUALITY, quality],
-    )
+    ok, buf = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        return
+
+    # Write next to the destination and rename over it so nothing reading
+    # the file ever sees a partially written image
+    tmp_filepath = filepath + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        with open(tmp_filepath, "wb") as f:
+            f.write(buf.tobytes())
+        os.replace(tmp_filepath, filepath)
+    except OSError as e:
+        log.warning(f"Could not save image {filepath}: {e}")
+
+
+def _save_debug_frame(frame_ring, filename, img):
+    # Without a filename the frame is for the stream, which reads it from
+    # shared memory; callers that give a path (e.g. hue calibration
+    # snapshots) get it written to disk
+    if filename is None:
+        frame_ring.publish(img)
+    else:
+        save_img(filename, img, rotated=False, quality=80)
 
 
 def hsv_detector(
@@ -78,8 +100,10 @@ def hsv_detector(
     if hue is None:
         hue = calibration.ball_hue
     kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, tuple(kernel_size))
+    # Stream frames go to shared memory for the stream server (opened lazily)
+    frame_ring = FrameRingWriter()
 
-    def detect_features(img, hue=hue, debug=debug, filename="/tmp/camera/frame.jpg"):
+    def detect_features(img, hue=hue, debug=debug, filename=None):
         # covert to HSV space
         img_hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
 
@@ -120,7 +144,7 @@ def hsv_detector(
                 if debug:
                     ball_center_pixels = (int(x_obs), int(y_obs))
                     draw_ball(img, ball_center_pixels, radius, hue)
-                    save_img(filename, img, rotated=False, quality=80)
+                    _save_debug_frame(frame_ring, filename, img)
 
                 # Rotate the x, y coordinates by -30 degrees
                 center = Vector2(x, y).rotate(np.radians(-30))
@@ -130,7 +154,7 @@ def hsv_detector(
         # If there were no contours or no contours the size of the ball
         ball_detected = False
         if debug:
-            save_img(filename, img, rotated=False, quality=80)
+            _save_debug_frame(frame_ring, filename, img)
         return ball_detected, (Vector2(0, 0), 0.0)
 
     return detect_features
@@ -143,8 +167,9 @@ def circle_test_detector(hue=44, debug=False, *args, **kwargs):
     scale = pixel_to_meter_ratio()
     radius = 256 * 0.4
     ball_radius_pixels = 256 * 0.1
+    frame_ring = FrameRingWriter()
 
-    def detect_features(img, hue=hue, debug=debug, filename="/tmp/camera/frame.jpg"):
+    def detect_features(img, hue=hue, debug=debug, filename=None):
         nonlocal angle
         angle += (1 / (time * frequency)) * (2 * np.pi)
         x_pixels, y_pixels = (radius * np.sin(angle), radius * np.cos(angle))
@@ -155,7 +180,7 @@ def circle_test_detector(hue=44, debug=False, *args, **kwargs):
             ball_center_pixels = (int(x_pixels), int(y_pixels))
             print(ball_center_pixels)
             draw_ball(img, ball_center_pixels, ball_radius_pixels, hue)
-            save_img(filename, img, rotated=False, quality=80)
+            _save_debug_frame(frame_ring, filename, img)
 
         x, y = x_pixels * scale, y_pixels * scale
         ball_detected = True
@@ -0,0 +1,72 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""
+Shared memory ring buffer of raw BGR camera frames.
+
+The menu publishes the frames it runs detection on and the stream server
+(stream/camera_ring.py) maps the same file to serve them, so frames are only
+JPEG encoded while someone is actually watching the stream.
+
+Layout: a 64 byte header of uint64 [count, slots, height, width, channels]
+followed by `slots` frames. `count` is the number of frames published so far;
+the newest frame is in slot (count - 1) % slots.
+"""
+
+import os
+import mmap
+import numpy as np
+
+FRAME_RING_PATH = "/dev/shm/moab_frames"
+HEADER_BYTES = 64
+
+
+class FrameRingWriter:
+    def __init__(self, path=FRAME_RING_PATH, slots=4):
+        self.path = path
+        self.slots = slots
+        self._mm = None
+        self._header = None
+        self._ring = None
+        self._shape = None
+
+    def _open(self, shape):
+        self.close()
+        h, w, c = shape
+        size = HEADER_BYTES + self.slots * h * w * c
+
+        # Build the ring in a new file and rename it into place. Truncating
+        # the existing file would make a reader still mapping the old size
+        # fault (SIGBUS); it keeps the old inode until it notices the rename.
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            self._mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        self._header = np.ndarray((5,), dtype=np.uint64, buffer=self._mm)
+        self._ring = np.ndarray(
+            (self.slots, h, w, c), dtype=np.uint8, buffer=self._mm, offset=HEADER_BYTES
+        )
+        self._header[:] = (0, self.slots, h, w, c)
+        self._shape = shape
+        os.replace(tmp_path, self.path)
+
+    def publish(self, img: np.ndarray):
+        if img.shape != self._shape:
+            self._open(img.shape)
+
+        # Fill the slot first, then bump the count so readers only ever see
+        # completed frames
+        count = int(self._header[0])
+        np.copyto(self._ring[count % self.slots], img)
+        self._header[0] = count + 1
+
+    def close(self):
+        if self._mm is not None:
+            self._header, self._ring = None, None
+            self._mm.close()
+            self._mm = None
+            self._shape = None
@@ -14,7 +14,7 @@ import RPi.GPIO as gpio
 from hexyl import hexyl
 from enum import IntEnum
 from dataclasses import dataclass, astuple
-from typing import Union, List, Tuple, Optional
+from typing import Union, List, Tuple, Optional, Sequence
 
 # fmt: off
 # Define which bytes represent which commands
@@ -98,14 +98,6 @@ def _xy_offsets(
     return x_offset, y_offset
 
 
-# Return an exact 8 byte numpy array
-def pad(*args, **kwargs):
-    data = [*args][:8]
-    pads = (8 - len(data)) * [0]
-    dtype = kwargs.pop("dtype", np.int8)
-    return np.array(data + pads, dtype)
-
-
 class Hat:
     """
     A helper class that solely does SPI messages. It contains some state for the
@@ -124,6 +116,10 @@ class Hat:
         if debug:
             self.hex_printer = hexyl()
         self.spi = None
+        # Reused for every SPI frame so sending a command doesn't allocate
+        self._tx_buf = bytearray(8)
+        # Earliest time the hat is ready for the next frame (time.monotonic)
+        self._not_before = 0.0
 
     def open(self):
         # Attempt to open the spidev bus
@@ -131,6 +127,8 @@ class Hat:
             self.spi = spidev.SpiDev()
             self.spi.open(0, 0)
             self.spi.max_speed_hz = 100000
+            self.spi.mode = 0b00
+            self.spi.no_cs = False
         except Exception as e:
             # possible that ctrl-C was caught here
             raise IOError(f"Could not open `/dev/spidev{spi_bus}.{spi_device}`.")
@@ -161,18 +159,34 @@ class Hat:
     def __exit__(self, type, value, traceback):
         self.close()
 
-    def transceive(self, packet: np.ndarray):
+    def transceive(self, packet: Sequence[int]):
         """
-        Send and receive 8 bytes from hat.
+        Send and receive 8 bytes from hat. Packets shorter than 8 bytes are
+        padded with trailing zeros.
         """
         assert self.spi is not None  # did you call hat.open() first ?
-        assert len(packet) == 8
-
-        hat_to_pi = self.spi.xfer(packet.tolist())
-        time.sleep(0.005)
+        assert len(packet) <= 8
+
+        tx = self._tx_buf
+        n = len(packet)
+        for i in range(n):
+            tx[i] = int(packet[i]) & 0xFF
+        for i in range(n, 8):
+            tx[i] = 0
+
+        # Only wait out whatever is left of the hat's processing time; the
+        # caller's own work since the last frame usually covers all of it
+        dt = self._not_before - time.monotonic()
+        if dt > 0:
+            time.sleep(dt)
+
+        # xfer2 holds chip select for the whole 8-byte frame instead of
+        # toggling it between bytes
+        hat_to_pi = self.spi.xfer2(tx)
+        self._not_before = time.monotonic() + 0.005
 
         if self.debug:
-            self.hex_printer(packet.tolist(), hat_to_pi, self.verbose)
+            self.hex_printer(tx, hat_to_pi, self.verbose)
 
         # Check if buttons are pressed
         self.buttons.menu_button = hat_to_pi[0] == 1
@@ -199,15 +213,15 @@ class Hat:
 
     def noop(self):
         """Send a NOOP. Useful for if you just want to read buttons."""
-        self.transceive(pad(SendCommand.NOOP))
+        self.transceive((SendCommand.NOOP,))
 
     def enable_servos(self):
         """Set the plate to track plate angles."""
-        self.transceive(pad(SendCommand.SERVO_ENABLE))
+        self.transceive((SendCommand.SERVO_ENABLE,))
 
     def disable_servos(self):
         """Disables the power to the servos."""
-        self.transceive(pad(SendCommand.SERVO_DISABLE))
+        self.transceive((SendCommand.SERVO_DISABLE,))
 
     def set_servos(
         self,
@@ -215,28 +229,21 @@ class Hat:
     ):
         # Note the off by 1 for indexing
         # Use fixed point 16-bit numbers, with precision of hundredths
-        servo1_centi_degrees = np.int16(servos[0] * 100)
-        servo2_centi_degrees = np.int16(servos[1] * 100)
-        servo3_centi_degrees = np.int16(servos[2] * 100)
-
-        # Get the first 8 bits and last 8 bits of every 16-bit integer
-        # (To send it as indivdual bytes)
-        servo1_centi_degrees_high_byte = servo1_centi_degrees >> 8
-        servo1_centi_degrees_low_byte = servo1_centi_degrees & 0x00FF
-        servo2_centi_degrees_high_byte = servo2_centi_degrees >> 8
-        servo2_centi_degrees_low_byte = servo2_centi_degrees & 0x00FF
-        servo3_centi_degrees_high_byte = servo3_centi_degrees >> 8
-        servo3_centi_degrees_low_byte = servo3_centi_degrees & 0x00FF
+        servo1_centi_degrees = int(servos[0] * 100)
+        servo2_centi_degrees = int(servos[1] * 100)
+        servo3_centi_degrees = int(servos[2] * 100)
 
+        # Send the high 8 bits and low 8 bits of every 16-bit integer as
+        # individual bytes (transceive masks each value down to a byte)
         self.transceive(
-            pad(
+            (
                 SendCommand.SET_SERVOS,
-                servo3_centi_degrees_high_byte,
-                servo3_centi_degrees_low_byte,
-                servo1_centi_degrees_high_byte,
-                servo1_centi_degrees_low_byte,
-                servo2_centi_degrees_high_byte,
-                servo2_centi_degrees_low_byte,
+                servo3_centi_degrees >> 8,
+                servo3_centi_degrees,
+                servo1_centi_degrees >> 8,
+                servo1_centi_degrees,
+                servo2_centi_degrees >> 8,
+                servo2_centi_degrees,
             )
         )
 
@@ -248,17 +255,21 @@ class Hat:
         assert len(s) <= 240, "String too long to send to hat."
 
         # Calculate the number of messages required to send the text
-        num_msgs = int(np.ceil(len(s) / 7))
+        num_msgs = (len(s) + 6) // 7
 
         # Pad the message with trailing termination chars to so we always
         # send in 8 bytes increments (1 byte control, 7 bytes data)
         s += (num_msgs * 7 - len(s)) * b"\0"
 
+        # One message buffer reused for every chunk (1 byte control, 7 data)
+        msg = bytearray(8)
+        msg[0] = SendCommand.COPY_STRING
+        view = memoryview(s)
         for msg_idx in range(num_msgs):
-            # Combine into one list to send
-            msg = [SendCommand.COPY_STRING] + list(s[7 * msg_idx : 7 * msg_idx + 7])
-            self.transceive(np.array(msg, dtype=np.int8))
-            time.sleep(0.010)
+            msg[1:] = view[7 * msg_idx : 7 * msg_idx + 7]
+            self.transceive(msg)
+            # On top of transceive's own 5 ms, as before (15 ms per chunk)
+            self._not_before += 0.010
 
     def display_power_symbol(self, text: str, icon_idx: PowerIcon):
         assert len(text) <= 12, "String is too long to display with icon"
@@ -267,7 +278,7 @@ class Hat:
         self._copy_buffer(text)
 
         # After sending copying to the fw buffer, display the buffer as a short string
-        self.transceive(pad(SendCommand.DISPLAY_POWER_SYMBOL, icon_idx))
+        self.transceive((SendCommand.DISPLAY_POWER_SYMBOL, icon_idx))
 
     def display_string_icon(self, text: str, icon_idx: Icon):
         # assert len(text) <= 12, "String is too long to display with icon"
@@ -276,7 +287,7 @@ class Hat:
         self._copy_buffer(text)
 
         # After sending copying to the fw buffer, display the buffer as a short string
-        self.transceive(pad(SendCommand.DISPLAY_BIG_TEXT_ICON, icon_idx))
+        self.transceive((SendCommand.DISPLAY_BIG_TEXT_ICON, icon_idx))
 
     def update_icon(self, icon_idx: Icon):
         # Don't needlessly update display if icon hasn't changed or if last text
@@ -284,7 +295,7 @@ class Hat:
         # display_long_string)
 
         # Display the buffer as a long string
-        self.transceive(pad(SendCommand.DISPLAY_BIG_TEXT_ICON, icon_idx))
+        self.transceive((SendCommand.DISPLAY_BIG_TEXT_ICON, icon_idx))
 
     def display_string(self, text: str):
         assert len(text) <= 15, "String is too long to display without scrolling."
@@ -293,11 +304,11 @@ class Hat:
         self._copy_buffer(text)
 
         # After sending copying to the fw buffer, display the buffer as a short string
-        self.transceive(pad(SendCommand.DISPLAY_BIG_TEXT))
+        self.transceive((SendCommand.DISPLAY_BIG_TEXT,))
 
     def display_long_string(self, text: str):
         # Copy the text into a buffer in the firmware
         self._copy_buffer(text)
 
         # After sending copying to the fw buffer, display the buffer as a long string
-        self.transceive(pad(SendCommand.DISPLAY_SMALL_TEXT))
+        self.transceive((SendCommand.DISPLAY_SMALL_TEXT,))
@@ -8,34 +8,48 @@ from random import *
 from time import *
 import socket
 import logging as log
+from functools import lru_cache
 from hat import Hat, Icon
 from env import MoabEnv
 
 
+@lru_cache(maxsize=1)
+def _lookup_host_ip():
+    # Raises when there's no network; lru_cache doesn't cache exceptions so
+    # the lookup is retried until it succeeds once
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect(("1.1.1.1", 1))
+        return s.getsockname()[0]  # returns string like '1.2.3.4'
+
+
 def _get_host_ip():
     ip = "127.0.0.1"
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("1.1.1.1", 1))
-        ip = s.getsockname()[0]  # returns string like '1.2.3.4'
+        ip = _lookup_host_ip()
     except Exception as e:
         print(f"No IP: {ip}")
 
     return ip
 
 
+@lru_cache(maxsize=1)
 def _get_sw_version():
     ver_string = os.environ.get("MOABIAN", "1.0.0")
-    ver_triplet = [int(b) for b in ver_string.split(".")]
+    ver_triplet = tuple(int(b) for b in ver_string.split("."))
     log.info(f"Version string: {ver_string}")
     log.info(f"Version triplet: {ver_triplet}")
     return ver_triplet
 
 
-def info_screen_controller(env, **kwargs):
+@lru_cache(maxsize=2)
+def _info_screen_text(ip):
+    # Keyed on the IP so the fallback address is replaced once the network is up
     sw_major, sw_minor, sw_bug = _get_sw_version()
-    ip = _get_host_ip()
-    s = f"VER {sw_major}.{sw_minor}.{sw_bug}\nIP {ip}"
+    return f"VER {sw_major}.{sw_minor}.{sw_bug}\nIP {ip}"
+
+
+def info_screen_controller(env, **kwargs):
+    s = _info_screen_text(_get_host_ip())
     env.hardware.display(s, scrolling=True)
 
     def wait_for_menu():
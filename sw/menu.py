@@ -79,7 +79,7 @@ def squash_small_angles(controller_fn, min_angle=1.0):
     return decorated_controller
 
 
-def build_menu(env, log_on, logfile):
+def build_menu(env, log_on, logfile, brain_timeout=0.2):
     log_csv = lambda fn: log_decorator(fn, logfile)
 
     top_menu = [
@@ -115,7 +115,11 @@ def build_menu(env, log_on, logfile):
         m = MenuOption(
             name=brain_image.short_name,
             closure=brain_controller,
-            kwargs={"port": brain_image.port, "alert_fn": alert_callback},
+            kwargs={
+                "port": brain_image.port,
+                "alert_fn": alert_callback,
+                "read_timeout": brain_timeout,
+            },
             decorators=[log_csv] if log_on else none,
         )
         middle_menu.append(m)
@@ -280,6 +284,13 @@ def _handle_debug(ctx, param, debug):
         "Location to dump matches the hour hand of a clock."
     ),
 )
+@click.option(
+    "--brain-timeout",
+    type=click.FloatRange(0.01, 10.0),
+    default=0.2,
+    help="Seconds to wait for a brain prediction before holding/leveling the plate",
+    show_default=True,
+)
 @click.pass_context
 def main(ctx: click.core.Context, **kwargs: Any) -> None:
     if kwargs["verbose"] == 2:
@@ -300,6 +311,7 @@ def main_menu(
     kiosk,
     kiosk_dump_location,
     kiosk_timeout,
+    brain_timeout,
 ):
 
     if reset:
@@ -307,7 +319,7 @@ def main_menu(
         os.system("raspi-gpio set 6 dh && sleep 0.05 && raspi-gpio set 6 dl")
 
     with MoabEnv(hertz, debug=debug, verbose=verbose) as env:
-        menu_list = build_menu(env, log, file)
+        menu_list = build_menu(env, log, file, brain_timeout)
 
         if cont == -1:
             # normal startup state
@@ -355,7 +367,7 @@ def main_menu(
                     # "Pull to refresh"
                     # If you go above the top of the menu, refresh the menu list
                     if index == 0:
-                        menu_list = build_menu(env, log, file)
+                        menu_list = build_menu(env, log, file, brain_timeout)
                         env.hardware.display("Refreshing", icon.BLANK)
                         time.sleep(0.5)
                         env.hardware.display(menu_list[index].name, icon)
@@ -411,6 +423,7 @@ def main_menu(
                                     status_of_ball = ball.getEntity(False)
                                 send.sendStatusOfBall(status_of_ball)
                                 old_status_ball = detected
+                            send.flush()
                             # --
 
                             # If the controller has been running for more than
@@ -421,6 +434,8 @@ def main_menu(
                                     # Send status of ball to Azure Table
                                     status_of_ball = ball.getEntity(False)
                                     send.sendStatusOfBall(status_of_ball)
+                                    # kiosk_mode blocks for seconds; send now
+                                    send.flush(force=True)
                                     old_status_ball = detected
                                     #--
                                     prev_state = (state, detected, buttons)
@@ -440,6 +455,10 @@ def main_menu(
 
                     except BrainNotFound:
                         print(f"caught BrainNotFound in loop")
+                        # Don't leave the last ball status unsent
+                        send.flush(force=True)
+                    else:
+                        send.flush(force=True)
 
                     env.hardware.go_up()
                 else:
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import sys, os, time, errno
+import sys, os, time, errno, fcntl
 import psutil
 import logging as log
 from psutil import Process, signal
@@ -7,10 +7,15 @@ from psutil import Process, signal
 
 def stop_doppelgänger(pid_path="/tmp/menu.pid"):
 
-    if os.path.isfile(pid_path):
-        if os.path.isfile(pid_path):
-            with open(pid_path, "r") as f:
-                pid = int(f.read())
+    # Hold an exclusive lock on the pid file while we read it, stop our twin
+    # and write our own pid, so two instances starting together can't race
+    fd = os.open(pid_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+        contents = os.read(fd, 32).strip()
+        if contents:
+            pid = int(contents)
 
             try:
                 twin = Process(pid)
@@ -31,9 +36,13 @@ def stop_doppelgänger(pid_path="/tmp/menu.pid"):
             except Exception as e:
                 print(f"Unexpected exception {e}")
 
-    this_pid = psutil.Process()
-    with open(pid_path, "w") as f:
-        f.write(str(this_pid.pid))
+        this_pid = psutil.Process()
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, str(this_pid.pid).encode())
+    finally:
+        os.close(fd)  # Also releases the lock
+
     return this_pid.pid
 
 
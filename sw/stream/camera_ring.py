@@ -0,0 +1,70 @@
+import os
+import cv2
+import mmap
+import time
+import numpy as np
+from base_camera import BaseCamera
+
+# Must match the layout written by sw/frame_ring.py:
+# uint64 [count, slots, height, width, channels] then `slots` BGR frames
+HEADER_BYTES = 64
+
+
+class CameraRing(BaseCamera):
+
+    @staticmethod
+    def frames():
+        path = os.getenv('MOABFRAMES', '/dev/shm/moab_frames')
+        quality = int(os.getenv('MOABQUALITY', 80))
+        mm = None
+        inode = None
+        last_count = 0
+
+        while True:
+            # The writer replaces the file (new inode) whenever it resizes
+            # the ring; drop the old mapping and pick up the new one
+            try:
+                current_inode = os.stat(path).st_ino
+            except FileNotFoundError:
+                current_inode = None
+            if mm is not None and current_inode != inode:
+                mm.close()
+                mm = None
+                last_count = 0  # A new ring counts from zero again
+
+            if mm is None:
+                try:
+                    with open(path, 'rb') as f:
+                        inode = os.fstat(f.fileno()).st_ino
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (FileNotFoundError, ValueError):
+                    # Nothing published yet
+                    time.sleep(0.5)
+                    continue
+
+            count, slots, h, w, c = (int(v) for v in np.frombuffer(mm, np.uint64, 5))
+            frame_bytes = h * w * c
+
+            # Not a complete ring (shouldn't happen since the writer renames
+            # it into place fully sized); look again shortly
+            if slots == 0 or len(mm) < HEADER_BYTES + slots * frame_bytes:
+                mm.close()
+                mm = None
+                time.sleep(0.1)
+                continue
+
+            if count == 0 or count == last_count:
+                time.sleep(0.01)
+                continue
+
+            offset = HEADER_BYTES + ((count - 1) % slots) * frame_bytes
+            frame = np.frombuffer(mm, np.uint8, frame_bytes, offset).reshape(h, w, c)
+            ok, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+            del frame
+
+            # If the writer lapped the ring while we were encoding, the slot
+            # may have been overwritten; skip it and take the newest instead
+            latest = int(np.frombuffer(mm, np.uint64, 1)[0])
+            last_count = count
+            if ok and latest - count < slots - 1:
+                yield buf.tobytes()
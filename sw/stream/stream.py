@@ -4,7 +4,7 @@ import os
 import socket
 import logging
 from flask import Flask, render_template, Response, url_for, redirect
-from camera_file import CameraFile
+from camera_ring import CameraRing
 from camera_opencv import CameraOpenCV
 
 app = Flask(__name__, static_url_path='', static_folder='static', template_folder='static')
@@ -27,7 +27,7 @@ def gen(camera):
 
 @app.route('/file_mjpeg')
 def video_mjpeg():
-    return Response(gen(CameraFile()),
+    return Response(gen(CameraRing()),
                     mimetype='multipart/x-mixed-replace; boundary=frame')
 
 @app.route('/opencv_mjpeg')